@@ -11,7 +11,7 @@ import networkx as nx
 import numpy as np
 from gensim.models import Word2Vec
 
-from graspologic.types import List, Tuple
+from graspologic.types import Dict, List, Tuple
 
 from ..utils import remap_node_ids
 
@@ -313,10 +313,14 @@ class _Node2VecGraph:
                     )
                 else:
                     prev = walk[-2]
+                    alias_edge = alias_edges.get((prev, current))
+                    if alias_edge is None:
+                        alias_edge = self._get_alias_edge(prev, current)
+                        alias_edges[(prev, current)] = alias_edge
                     next = current_neighbors[
                         _alias_draw(
-                            alias_edges[(prev, current)][0],
-                            alias_edges[(prev, current)][1],
+                            alias_edge[0],
+                            alias_edge[1],
                             self.random_state,
                         )
                     ]
@@ -429,7 +433,6 @@ class _Node2VecGraph:
         Preprocessing of transition probabilities for guiding the random walks.
         """
         graph = self.graph
-        is_directed = self.is_directed
 
         alias_nodes = {}
         total_nodes = len(graph.nodes())
@@ -459,35 +462,11 @@ class _Node2VecGraph:
             f"Completed preprocessing of transition probabilities for vertices"
         )
 
-        alias_edges = {}
-
-        total_edges = len(graph.edges())
-        bucket = 0
-        current_edge = 0
-        quotient = int(total_edges / 10)
-
-        logging.info(
-            f"Beginning preprocessing of transition probabilities for {total_edges} edges"
-        )
-        if is_directed:
-            for edge in graph.edges():
-                current_edge += 1
-                if current_edge > bucket * quotient:
-                    bucket += 1
-                    logging.info(f"Completed {current_edge} / {total_edges} edges")
-
-                alias_edges[edge] = self._get_alias_edge(edge[0], edge[1])
-        else:
-            for edge in graph.edges():
-                current_edge += 1
-                if current_edge > bucket * quotient:
-                    bucket += 1
-                    logging.info(f"Completed {current_edge} / {total_edges} edges")
-
-                alias_edges[edge] = self._get_alias_edge(edge[0], edge[1])
-                alias_edges[(edge[1], edge[0])] = self._get_alias_edge(edge[1], edge[0])
-
-        logging.info(f"Completed preprocessing of transition probabilities for edges")
+        # second-order transition probabilities depend on the (previous, current)
+        # edge and cost O(degree) each to set up, so their alias tables are built
+        # lazily the first time a walk traverses an edge rather than for every edge
+        # up front
+        alias_edges: Dict[Tuple[Any, Any], Tuple[np.ndarray, np.ndarray]] = {}
 
         self.alias_nodes = alias_nodes
         self.alias_edges = alias_edges
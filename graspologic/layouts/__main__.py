@@ -4,10 +4,12 @@
 import argparse
 import logging
 import sys
+import warnings
 from pathlib import Path
 from typing import Any
 
 import networkx as nx
+import pandas as pd
 
 from graspologic.types import Dict, List
 
@@ -21,30 +23,41 @@ def _graph_from_file(
 ) -> nx.Graph:
     logger = logging.getLogger("graspologic.layouts")
     graph = nx.Graph()
-    with open(path, "r") as edge_io:
-        if skip_header is True:
-            next(edge_io)
-        first = True
-        for line in edge_io:
-            weight: float
-            split_vals = line.strip().split(",")
-            if len(split_vals) == 3:
-                source, target, weight_str = split_vals
-                weight = float(weight_str)
-            elif len(split_vals) == 2:
-                if first:
-                    logger.warn("No weights found in edge list, using 1.0")
-                    first = False
-                source, target = split_vals[:2]
-                weight = 1.0
-            else:  # drop it because it is malformed
-                if len(split_vals) == 0:
-                    pass  # do nothing for blank lines
-                else:
-                    raise IOError(f"Expected 2 or 3 columns in {path}, no more or less")
-            if graph.has_edge(source, target):
-                weight += graph[source][target]["weight"]
-            graph.add_edge(source, target, weight=weight)
+    malformed = f"Expected 2 or 3 columns in {path}, no more or less"
+    try:
+        # rows are read into a fixed 3 column layout so a missing weight is an empty
+        # cell; rows with extra fields either fail to tokenize or, on the first row,
+        # raise a ParserWarning about dropping data
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", pd.errors.ParserWarning)
+            edges = pd.read_csv(
+                path,
+                header=None,
+                names=[0, 1, 2],
+                index_col=False,
+                skiprows=1 if skip_header else 0,
+                dtype=str,
+                keep_default_na=False,
+            )
+    except pd.errors.EmptyDataError:
+        return graph
+    except (pd.errors.ParserError, pd.errors.ParserWarning) as error:
+        raise IOError(malformed) from error
+
+    if (edges[1] == "").any():
+        raise IOError(malformed)
+    unweighted = edges[2] == ""
+    if unweighted.any():
+        logger.warn("No weights found in edge list, using 1.0")
+    try:
+        weights = edges[2].mask(unweighted, "1.0").astype(float).tolist()
+    except ValueError as error:
+        raise IOError(f"Edge weights in {path} must be numeric") from error
+
+    for source, target, weight in zip(edges[0].tolist(), edges[1].tolist(), weights):
+        if graph.has_edge(source, target):
+            weight += graph[source][target]["weight"]
+        graph.add_edge(source, target, weight=weight)
     return graph
 
 
@@ -99,22 +112,30 @@ def _umap(arguments: argparse.Namespace) -> None:
 
 
 def _render(arguments: argparse.Namespace) -> None:
-    positions = []
-    node_colors = {}
-    with open(arguments.location_file, "r") as location_io:
-        next(location_io)
-        for line in location_io:
-            node_id, x, y, size, community, color = line.strip().split(",")
-            positions.append(
-                NodePosition(node_id, float(x), float(y), float(size), int(community))
-            )
-            node_colors[node_id] = color
+    locations = pd.read_csv(
+        arguments.location_file,
+        header=0,
+        names=["id", "x", "y", "size", "community", "color"],
+        dtype={"id": str, "color": str},
+        keep_default_na=False,
+    )
+    node_ids = locations["id"].tolist()
+    positions = [
+        NodePosition(node_id, x, y, size, community)
+        for node_id, x, y, size, community in zip(
+            node_ids,
+            locations["x"].astype(float).tolist(),
+            locations["y"].astype(float).tolist(),
+            locations["size"].astype(float).tolist(),
+            locations["community"].astype(int).tolist(),
+        )
+    ]
+    node_colors = dict(zip(node_ids, locations["color"].tolist()))
     if arguments.edge_list is not None:
         graph = _graph_from_file(arguments.edge_list, arguments.skip_header)
     else:
         graph = nx.Graph()
-        for position in positions:
-            graph.add_node(position.node_id)
+        graph.add_nodes_from(node_ids)
 
     render.save_graph(
         arguments.image_file,
@@ -16,7 +16,7 @@ from graspologic.types import Dict, List, Tuple
 from ..embed import node2vec_embed
 from ..partition import leiden
 from ..preconditions import is_real_weighted
-from ..preprocessing import cut_edges_by_weight, histogram_edge_weight
+from ..preprocessing import cut_edges_by_weight
 from ..utils import largest_connected_component
 from .classes import NodePosition
 from .nooverlap import remove_overlaps
@@ -215,23 +215,27 @@ def layout_umap(
 
 
 def _approximate_prune(graph: nx.Graph, max_edges_to_keep: int = 1000000) -> nx.Graph:
-    num_edges = len(graph.edges())
+    num_edges = graph.number_of_edges()
     logger.info(f"num edges: {num_edges}")
 
     if num_edges > max_edges_to_keep:
-        histogram, bins = histogram_edge_weight(graph, bin_directive=100)
-        counts = 0
-        bin_edge_for_maximum_weight = bins[0]
-        for i, count in reversed(list(enumerate(histogram))):
-            counts += count
-            if counts >= max_edges_to_keep:
-                bin_edge_for_maximum_weight = bins[i + 1]
-                break
-        threshold = bin_edge_for_maximum_weight
-        graph = cut_edges_by_weight(
-            graph, cut_threshold=threshold, cut_process="smaller_than_inclusive"
+        weights = np.fromiter(
+            (
+                weight
+                for _, _, weight in graph.edges(data="weight")
+                if weight is not None
+            ),
+            dtype=np.float64,
         )
-        logger.debug(f"after cut num edges: {len(graph.edges())}")
+        # the heaviest weight we must drop: cutting everything at or below it leaves
+        # at most max_edges_to_keep edges
+        drop_index = weights.size - max_edges_to_keep - 1
+        if drop_index >= 0:
+            threshold = float(np.partition(weights, drop_index)[drop_index])
+            graph = cut_edges_by_weight(
+                graph, cut_threshold=threshold, cut_process="smaller_than_inclusive"
+            )
+            logger.debug(f"after cut num edges: {graph.number_of_edges()}")
 
     return graph
 
@@ -302,16 +306,18 @@ def _node_positions_from(
         partitions = leiden(temp_graph, random_seed=random_seed)
     else:
         partitions = leiden(graph, random_seed=random_seed)
-    positions = [
-        NodePosition(
-            node_id=str(key),
-            x=scaled_points[index][0],
-            y=scaled_points[index][1],
-            size=sizes[key],
-            community=partitions[key],
+    positions = list(
+        map(
+            NodePosition._make,
+            zip(
+                [str(key) for key in labels],
+                scaled_points[:, 0].tolist(),
+                scaled_points[:, 1].tolist(),
+                [sizes[key] for key in labels],
+                [partitions[key] for key in labels],
+            ),
         )
-        for index, key in enumerate(labels)
-    ]
+    )
     if adjust_overlaps is True:
         positions = remove_overlaps(positions)
     return positions
@@ -3,28 +3,37 @@
 
 import atexit
 import json
-import math
-import os
+from collections import Counter
+from functools import lru_cache
 from itertools import cycle
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import numpy as np
-import pkg_resources
-from sklearn.preprocessing import minmax_scale
 
 from graspologic.types import Dict, Tuple
 
 __all__ = ["categorical_colors", "sequential_colors"]
 
 
+@lru_cache(maxsize=1)
+def _include_path() -> Path:
+    try:
+        from importlib.resources import files
+    except ImportError:  # python < 3.9
+        import pkg_resources
+
+        atexit.register(pkg_resources.cleanup_resources)
+        return Path(pkg_resources.resource_filename(__package__, "include"))
+    return Path(str(files(__package__) / "include"))
+
+
 def _load_thematic_json(path: Optional[str]) -> Tuple[Dict[Any, Any], Dict[Any, Any]]:
+    colors_path: Union[str, Path]
     if path is not None and Path(path).is_file():
         colors_path = path
     else:
-        atexit.register(pkg_resources.cleanup_resources)
-        include_path = pkg_resources.resource_filename(__package__, "include")
-        colors_path = os.path.join(include_path, "colors-100.json")
+        colors_path = _include_path() / "colors-100.json"
 
     with open(colors_path) as thematic_json_io:
         thematic_json = json.load(thematic_json_io)
@@ -87,20 +96,13 @@ def categorical_colors(
 
     """
     color_scheme = _get_colors(light_background, theme_path)
-    partition_populations: Dict[Any, int] = {}
-    for node_id, partition in partitions.items():
-        count = partition_populations.get(partition, 0) + 1
-        partition_populations[partition] = count
-
-    ordered_partitions = sorted(
-        partition_populations.items(), key=lambda x: x[1], reverse=True
-    )
-    nominal_cycle = cycle(color_scheme["nominal"])
-    colors_by_partitions = {}
-    for index, item in enumerate(ordered_partitions):
-        partition, _ = item
-        color = next(nominal_cycle)
-        colors_by_partitions[partition] = color
+    ordered_partitions = Counter(partitions.values()).most_common()
+    colors_by_partitions = {
+        partition: color
+        for (partition, _), color in zip(
+            ordered_partitions, cycle(color_scheme["nominal"])
+        )
+    }
 
     colors_by_node = {
         node_id: colors_by_partitions[partition]
@@ -139,7 +141,7 @@ def sequential_colors(
         Default is ``True``. Colors selected for a light background will be slightly
         different in hue and saturation to complement a light or dark background.
     use_log_scale : bool
-        Default is ``False``.
+        Default is ``False``. If ``True``, all values must be greater than 0.
     theme_path : Optional[str]
         A color scheme is provided with ``graspologic``, but if you wish to use your own
         you can generate one with `Thematic <https://microsoft.github.io/thematic>`_ and
@@ -156,18 +158,24 @@ def sequential_colors(
     color_list = color_scheme["sequential"]
     num_colors = len(color_list)
 
-    keys, values = zip(*node_and_value.items())
+    keys = list(node_and_value.keys())
+    values = np.fromiter(
+        node_and_value.values(), dtype=np.float64, count=len(node_and_value)
+    )
 
     if use_log_scale:
-        values = map(math.log, values)
-
-    np_values = np.array(values).reshape(1, -1)
-    new_values = minmax_scale(np_values, feature_range=(0, num_colors - 1), axis=1)
-    node_colors = {}
-    for key_index, node_id in enumerate(keys):
-        index = int(new_values[0, key_index])
-
-        color = color_list[index]
-        node_colors[node_id] = color
-
-    return node_colors
+        if np.any(values <= 0):
+            msg = "All values must be greater than 0 when use_log_scale is True"
+            raise ValueError(msg)
+        np.log(values, out=values)
+
+    # scale the values into the range of color indices
+    min_value = values.min()
+    value_range = values.max() - min_value
+    scale = (num_colors - 1) / value_range if value_range != 0 else 0.0
+    values *= scale
+    values -= min_value * scale
+    color_indices = values.astype(np.int64)
+
+    colors = np.asarray(color_list)[color_indices]
+    return dict(zip(keys, colors.tolist()))
@@ -5,6 +5,7 @@ from typing import Any
 
 import matplotlib.pyplot as plt
 import networkx as nx
+import numpy as np
 
 from graspologic.layouts.classes import NodePosition
 from graspologic.types import Dict, List, Tuple
@@ -16,13 +17,20 @@ def _calculate_x_y_domain(
     """calculate the overall x/y domain, converting to a square
     so we can have a consistent scale
     """
-    min_x = min_y = float("inf")
-    max_x = max_y = float("-inf")
-    for node_position in positions:
-        min_x = min(min_x, node_position.x - node_position.size)
-        max_x = max(max_x, node_position.x + node_position.size)
-        min_y = min(min_y, node_position.y - node_position.size)
-        max_y = max(max_y, node_position.y + node_position.size)
+    # gather x, y and size into contiguous columns so the bounds are found in
+    # vectorized passes rather than per node
+    x, y, size = (
+        np.array(
+            [(position.x, position.y, position.size) for position in positions],
+            dtype=np.float64,
+        )
+        .reshape(-1, 3)
+        .T
+    )
+    min_x = float(np.min(x - size, initial=np.inf))
+    max_x = float(np.max(x + size, initial=-np.inf))
+    min_y = float(np.min(y - size, initial=np.inf))
+    max_y = float(np.max(y + size, initial=-np.inf))
 
     x_delta = max_x - min_x
     y_delta = max_y - min_y
@@ -40,14 +48,6 @@ def _calculate_x_y_domain(
     return (min_x, max_x), (min_y, max_y)
 
 
-def _scale_value(
-    domain: Tuple[float, float], data_range: Tuple[float, float], value: float
-) -> float:
-    return data_range[0] + (data_range[1] - data_range[0]) * (
-        (value - domain[0]) / (domain[1] - domain[0])
-    )
-
-
 def _scale_node_sizes_for_rendering(
     sizes: List[float],
     spatial_domain: Tuple[float, float],
@@ -61,11 +61,12 @@ def _scale_node_sizes_for_rendering(
 
     There are 72 points per inch. Multiplying by 72 / dpi converts from pixels to points.
     """
-    spatial_domain = (0, spatial_domain[1] - spatial_domain[0])
-    return [
-        _scale_value(spatial_domain, spatial_range, s * 2 * 72.0 / dpi) ** 2
-        for s in sizes
-    ]
+    domain_width = spatial_domain[1] - spatial_domain[0]
+    points = np.asarray(sizes, dtype=np.float64) * 2 * 72.0 / dpi
+    scaled = spatial_range[0] + (spatial_range[1] - spatial_range[0]) * (
+        points / domain_width
+    )
+    return (scaled**2).tolist()
 
 
 def _draw_graph(
@@ -82,10 +83,10 @@ def _draw_graph(
     arrows: bool = False,
     dpi: int = 100,
 ) -> None:
-    if len(positions) != len(graph.nodes()):
+    if len(positions) != graph.number_of_nodes():
         raise ValueError(
             f"The number of positions provided {len(positions)} is not the same as the "
-            f"number of nodes in the graph {len(graph.nodes())}"
+            f"number of nodes in the graph {graph.number_of_nodes()}"
         )
     for position in positions:
         if position.node_id not in graph:
@@ -167,7 +167,7 @@ def omnibus_embedding_pairwise(
 
     union_graph_lcc: Union[
         nx.Graph, nx.Digraph, nx.OrderedGraph, nx.OrderedDiGraph
-    ] = largest_connected_component(union_graph)
+    ] = largest_connected_component(union_graph, copy=False)
     union_graph_lcc_nodes: Set[Any] = set(list(union_graph_lcc.nodes()))
 
     union_node_ids = np.array(list(union_graph_lcc_nodes))
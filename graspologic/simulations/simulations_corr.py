@@ -3,9 +3,9 @@
 
 from typing import Union
 
+import numba as nb
 import numpy as np
 
-from graspologic.simulations import sample_edges
 from graspologic.types import List, Tuple
 
 
@@ -35,15 +35,20 @@ def check_rel_er(p: float, r: float) -> None:
 
 
 def check_rel_sbm(p: np.ndarray, r: float) -> None:
-    for i in range(np.array(p).shape[0]):
-        for j in range(np.array(p).shape[1]):
-            if p[i][j] + r * (1 - p[i][j]) < 0:
-                msg = "p + r * (1 - p) should be bigger than 0"
-                raise ValueError(msg)
+    p = np.asarray(p, dtype=np.float64)
+    if np.any(p + r * (1 - p) < 0):
+        msg = "p + r * (1 - p) should be bigger than 0"
+        raise ValueError(msg)
 
-            elif p[i][j] * (1 - r) < 0:
-                msg = "p * (1 - r) should be bigger than 0"
-                raise ValueError(msg)
+    if np.any(p * (1 - r) < 0):
+        msg = "p * (1 - r) should be bigger than 0"
+        raise ValueError(msg)
+
+
+def check_probabilities(X: np.ndarray, name: str) -> None:
+    if not np.all((X >= 0) & (X <= 1)):
+        msg = "{} must be between 0 and 1 and cannot contain NaNs".format(name)
+        raise ValueError(msg)
 
 
 def sample_edges_corr(
@@ -94,14 +99,14 @@ def sample_edges_corr(
 
     >>> sample_edges_corr(P, R, directed = False, loops = False)
     (array([[0., 1., 0., 0., 0.],
-            [1., 0., 0., 0., 0.],
-            [0., 0., 0., 0., 1.],
-            [0., 0., 0., 0., 1.],
-            [0., 0., 1., 1., 0.]]), array([[0., 1., 0., 0., 0.],
-            [1., 0., 1., 0., 1.],
-            [0., 1., 0., 1., 1.],
-            [0., 0., 1., 0., 1.],
-            [0., 1., 1., 1., 0.]]))
+           [1., 0., 1., 0., 0.],
+           [0., 1., 0., 1., 1.],
+           [0., 0., 1., 0., 1.],
+           [0., 0., 1., 1., 0.]]), array([[0., 0., 0., 1., 1.],
+           [0., 0., 0., 1., 0.],
+           [0., 0., 0., 1., 1.],
+           [1., 1., 1., 0., 1.],
+           [1., 0., 1., 1., 0.]]))
     """
     # test input
     # check P
@@ -123,13 +128,65 @@ def sample_edges_corr(
     # check directed and loops
     check_dirloop(directed, loops)
 
-    G1 = sample_edges(P, directed=directed, loops=loops)
-    P2 = G1.copy()
-    P2 = np.where(P2 == 1, P + R * (1 - P), P * (1 - R))
-    G2 = sample_edges(P2, directed=directed, loops=loops)
+    # check that P and the conditional edge probabilities of G2 are valid, since
+    # thresholding uniform draws would otherwise silently clip them
+    check_probabilities(P, "P")
+    check_probabilities(P + R * (1 - P), "P + R * (1 - P)")
+    check_probabilities(P * (1 - R), "P * (1 - R)")
+
+    # G2 is drawn against P2 = P + R * (1 - P) where G1 has an edge and P * (1 - R)
+    # elsewhere, which simplifies to P + R * (G1 - P) since G1 is binary
+    if directed:
+        # both uniform fields are drawn in a single call
+        U = np.random.random_sample((2,) + P.shape)
+        G1 = (U[0] < P).astype(np.float64)
+        P2 = G1 - P
+        P2 *= R
+        P2 += P
+        G2 = (U[1] < P2).astype(np.float64)
+        if not loops:
+            np.fill_diagonal(G1, 0)
+            np.fill_diagonal(G2, 0)
+    else:
+        # a single compiled pass over the upper triangle draws both graphs entry by
+        # entry, so neither the uniform fields nor P2 are materialized. the kernel's
+        # seed comes from the global numpy state so np.random.seed still applies.
+        # the kernel reseeds np.random, which only touches numba's own generator
+        # when compiled; the caller's state is restored for when JIT is disabled
+        seed = np.random.randint(np.iinfo(np.uint32).max, dtype=np.int64)
+        state = np.random.get_state()
+        try:
+            G1, G2 = _sample_undirected_edges_corr_numba(P, R, loops, seed)
+        finally:
+            np.random.set_state(state)
     return G1, G2
 
 
+def _sample_undirected_edges_corr_jit_source(
+    P: np.ndarray, R: np.ndarray, loops: bool, seed: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    np.random.seed(seed)
+    n_vertices = P.shape[0]
+    G1 = np.zeros((n_vertices, n_vertices))
+    G2 = np.zeros((n_vertices, n_vertices))
+    for i in range(n_vertices):
+        for j in range(i if loops else i + 1, n_vertices):
+            p = P[i, j]
+            g1 = 1.0 if np.random.random() < p else 0.0
+            p2 = p + R[i, j] * (g1 - p)
+            g2 = 1.0 if np.random.random() < p2 else 0.0
+            G1[i, j] = g1
+            G1[j, i] = g1
+            G2[i, j] = g2
+            G2[j, i] = g2
+    return G1, G2
+
+
+_sample_undirected_edges_corr_numba = nb.jit(
+    _sample_undirected_edges_corr_jit_source, nopython=True
+)
+
+
 def er_corr(
     n: int, p: float, r: float, directed: bool = False, loops: bool = False
 ) -> Tuple[np.ndarray, np.ndarray]:
@@ -174,15 +231,15 @@ def er_corr(
     To sample a correlated ER graph pair based on n, p and r:
 
     >>> er_corr(n, p, r, directed=False, loops=False)
-    (array([[0., 0., 1., 0., 0.],
-        [0., 0., 0., 1., 0.],
-        [1., 0., 0., 1., 1.],
-        [0., 1., 1., 0., 1.],
-        [0., 0., 1., 1., 0.]]), array([[0., 1., 1., 1., 0.],
-        [1., 0., 0., 1., 0.],
-        [1., 0., 0., 1., 1.],
-        [1., 1., 1., 0., 1.],
-        [0., 0., 1., 1., 0.]]))
+    (array([[0., 0., 0., 0., 0.],
+           [0., 0., 0., 0., 0.],
+           [0., 0., 0., 1., 0.],
+           [0., 0., 1., 0., 1.],
+           [0., 0., 0., 1., 0.]]), array([[0., 0., 1., 0., 1.],
+           [0., 0., 1., 0., 0.],
+           [1., 1., 0., 0., 1.],
+           [0., 0., 0., 0., 1.],
+           [1., 0., 1., 1., 0.]]))
     """
     # test input
     # check n
@@ -264,17 +321,17 @@ def sbm_corr(
     To sample a correlated SBM graph pair based on n, p and r:
 
     >>> sbm_corr(n, p, r, directed=False, loops=False)
-    (array([[0., 1., 0., 0., 0., 0.],
-        [1., 0., 0., 0., 0., 0.],
-        [0., 0., 0., 0., 0., 0.],
-        [0., 0., 0., 0., 0., 1.],
-        [0., 0., 0., 0., 0., 0.],
-        [0., 0., 0., 1., 0., 0.]]), array([[0., 1., 0., 0., 0., 0.],
-        [1., 0., 0., 1., 1., 0.],
-        [0., 0., 0., 0., 0., 0.],
-        [0., 1., 0., 0., 0., 1.],
-        [0., 1., 0., 0., 0., 0.],
-        [0., 0., 0., 1., 0., 0.]]))
+    (array([[0., 1., 1., 0., 0., 0.],
+           [1., 0., 0., 0., 0., 0.],
+           [1., 0., 0., 0., 1., 0.],
+           [0., 0., 0., 0., 0., 1.],
+           [0., 0., 1., 0., 0., 0.],
+           [0., 0., 0., 1., 0., 0.]]), array([[0., 1., 1., 0., 0., 0.],
+           [1., 0., 0., 0., 0., 0.],
+           [1., 0., 0., 0., 0., 0.],
+           [0., 0., 0., 0., 0., 1.],
+           [0., 0., 0., 0., 0., 0.],
+           [0., 0., 0., 1., 0., 0.]]))
     """
     # test input
     # Check n
@@ -312,14 +369,8 @@ def sbm_corr(
     # check directed and loops
     check_dirloop(directed, loops)
 
-    P = np.zeros((np.sum(n), np.sum(n)))
-    block_indices = np.insert(np.cumsum(np.array(n)), 0, 0)
-    for i in range(np.array(p).shape[0]):  # for each row
-        for j in range(np.array(p).shape[1]):  # for each column
-            P[
-                block_indices[i] : block_indices[i + 1],
-                block_indices[j] : block_indices[j + 1],
-            ] = p[i][j]
-    R = r * np.ones((np.sum(n), np.sum(n)))
+    # expand each block probability into an n[i] x n[j] block of P
+    P = np.repeat(np.repeat(p, n, axis=0), n, axis=1).astype(np.float64)
+    R = np.full((np.sum(n), np.sum(n)), r)
     G1, G2 = sample_edges_corr(P, R, directed=directed, loops=loops)
     return G1, G2
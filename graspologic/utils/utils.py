@@ -19,7 +19,7 @@ from sklearn.utils import check_array, check_consistent_length, column_or_1d
 from sklearn.utils.multiclass import type_of_target, unique_labels
 from typing_extensions import Literal
 
-from graspologic.types import Dict, List, Tuple
+from graspologic.types import Dict, List, Set, Tuple
 
 from ..types import GraphRepresentation
 
@@ -545,11 +545,20 @@ def is_fully_connected(graph: GraphRepresentation) -> bool:
         return nx.is_connected(graph)
 
 
+# component generators keyed by graph.is_directed(); directed graphs are searched for
+# weakly connected components
+_NETWORKX_COMPONENT_FUNCTIONS: Dict[bool, Callable[[Any], Iterable[Set[Any]]]] = {
+    False: nx.connected_components,
+    True: nx.weakly_connected_components,
+}
+
+
 def largest_connected_component(
     graph: Union[
         nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph, np.ndarray, csr_array
     ],
     return_inds: bool = False,
+    copy: bool = True,
 ) -> Union[nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph, np.ndarray, csr_array]:
     r"""
     Finds the largest connected component for the input graph.
@@ -567,6 +576,11 @@ def largest_connected_component(
         Whether to return a np.ndarray containing the indices/nodes in the original
         adjacency matrix that were kept and are now in the returned graph.
 
+    copy: boolean, default: True
+        Only used for networkx graphs. If False, returns a read-only subgraph view of
+        ``graph`` instead of a copy, which avoids duplicating the nodes and edges of
+        the largest connected component when the result is not modified.
+
     Returns
     -------
     graph: nx.Graph, nx.DiGraph, nx.MultiDiGraph, nx.MultiGraph, np.ndarray, scipy.sparse.csr_array
@@ -585,7 +599,9 @@ def largest_connected_component(
     """
 
     if isinstance(graph, (nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph)):
-        return _largest_connected_component_networkx(graph, return_inds=return_inds)
+        return _largest_connected_component_networkx(
+            graph, return_inds=return_inds, copy=copy
+        )
     elif isinstance(graph, (np.ndarray, csr_array)):
         return _largest_connected_component_adjacency(graph, return_inds=return_inds)
     else:
@@ -599,13 +615,13 @@ def largest_connected_component(
 def _largest_connected_component_networkx(
     graph: Union[nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph],
     return_inds: bool = False,
+    copy: bool = True,
 ) -> Union[nx.Graph, Tuple[nx.Graph, np.ndarray]]:
-    if type(graph) in [nx.Graph, nx.MultiGraph]:
-        lcc_nodes = max(nx.connected_components(graph), key=len)
-    elif type(graph) in [nx.DiGraph, nx.MultiDiGraph]:
-        lcc_nodes = max(nx.weakly_connected_components(graph), key=len)
-    lcc = graph.subgraph(lcc_nodes).copy()
-    lcc.remove_nodes_from([n for n in lcc if n not in lcc_nodes])
+    components = _NETWORKX_COMPONENT_FUNCTIONS[graph.is_directed()](graph)
+    lcc_nodes: Set[Any] = _largest_component_nodes(components, graph.number_of_nodes())
+    lcc = graph.subgraph(lcc_nodes)
+    if copy:
+        lcc = lcc.copy()
     if return_inds:
         nodelist = np.array(list(lcc_nodes))
     if return_inds:
@@ -614,6 +630,20 @@ def _largest_connected_component_networkx(
         return lcc
 
 
+def _largest_component_nodes(components: Iterable[Set[Any]], n_nodes: int) -> Set[Any]:
+    # equivalent to max(components, key=len), but stops generating components once
+    # the nodes not yet visited could not form a larger one
+    largest: Set[Any] = set()
+    n_seen = 0
+    for component in components:
+        if len(component) > len(largest):
+            largest = component
+        n_seen += len(component)
+        if len(largest) >= n_nodes - n_seen:
+            break
+    return largest
+
+
 def _largest_connected_component_adjacency(
     adjacency: Union[np.ndarray, csr_array],
     return_inds: bool = False,
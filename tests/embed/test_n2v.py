@@ -197,3 +197,22 @@ class Node2VecEmbedTest(unittest.TestCase):
         n2v._preprocess_transition_probabilities()
         walk = n2v.node2vec_walk(5, start_node, None)
         self.assertGreater(len(walk), 0)
+
+    def test_alias_edges_are_cached_lazily_by_walked_edge(self):
+        random_state = np.random.RandomState(1234)
+        graph = nx.complete_graph(6, create_using=nx.DiGraph)
+        for source, target in graph.edges():
+            graph[source][target]["weight"] = random_state.uniform(0.1, 10.0)
+
+        n2v = gc.embed.n2v._Node2VecGraph(graph, 0.5, 2.0, random_state)
+        n2v._preprocess_transition_probabilities()
+        self.assertEqual({}, n2v.alias_edges)
+
+        walks = [n2v.node2vec_walk(20, node, None) for node in n2v.graph.nodes()]
+        # every step after the first is drawn from the table of the edge just walked
+        walked_edges = {edge for walk in walks for edge in zip(walk[:-2], walk[1:-1])}
+        self.assertEqual(walked_edges, set(n2v.alias_edges))
+        for (prev, current), (j, q) in n2v.alias_edges.items():
+            expected_j, expected_q = n2v._get_alias_edge(prev, current)
+            np.testing.assert_array_equal(expected_j, j)
+            np.testing.assert_array_equal(expected_q, q)
@@ -7,7 +7,7 @@ import unittest
 import networkx as nx
 import numpy
 
-from graspologic.layouts.auto import _get_bounds, layout_umap
+from graspologic.layouts.auto import _approximate_prune, _get_bounds, layout_umap
 
 
 class TestAuto(unittest.TestCase):
@@ -74,6 +74,17 @@ class TestAuto(unittest.TestCase):
         result_graph, positions = layout_umap(graph, max_edges=100)
         self.assertTrue(result_graph.number_of_edges() <= 100)
 
+    def test_approximate_prune_keeps_heaviest_edges(self):
+        graph = nx.Graph()
+        for i in range(10):
+            graph.add_edge(i, i + 1, weight=float(i))
+
+        pruned = _approximate_prune(graph, max_edges_to_keep=4)
+        self.assertEqual(
+            sorted(weight for _, _, weight in pruned.edges(data="weight")),
+            [6.0, 7.0, 8.0, 9.0],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
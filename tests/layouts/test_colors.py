@@ -0,0 +1,48 @@
+# Copyright (c) Microsoft Corporation and contributors.
+# Licensed under the MIT License.
+
+import unittest
+
+from graspologic.layouts.colors import (
+    _CACHED_LIGHT,
+    categorical_colors,
+    sequential_colors,
+)
+
+
+class TestColors(unittest.TestCase):
+    def test_categorical_colors_ordered_by_population(self):
+        color_list = _CACHED_LIGHT["nominal"]
+        partitions = {"a": 1, "b": 0, "c": 0, "d": 2, "e": 1, "f": 0}
+        node_colors = categorical_colors(partitions)
+        self.assertEqual(color_list[0], node_colors["b"])
+        self.assertEqual(color_list[0], node_colors["f"])
+        self.assertEqual(color_list[1], node_colors["a"])
+        self.assertEqual(color_list[2], node_colors["d"])
+
+    def test_sequential_colors_range(self):
+        color_list = _CACHED_LIGHT["sequential"]
+        node_colors = sequential_colors({"a": 1.0, "b": 5.5, "c": 10.0})
+        self.assertEqual(color_list[0], node_colors["a"])
+        self.assertEqual(color_list[(len(color_list) - 1) // 2], node_colors["b"])
+        self.assertEqual(color_list[-1], node_colors["c"])
+
+    def test_sequential_colors_log_scale(self):
+        color_list = _CACHED_LIGHT["sequential"]
+        node_colors = sequential_colors({"a": 1, "b": 100}, use_log_scale=True)
+        self.assertEqual(color_list[0], node_colors["a"])
+        self.assertEqual(color_list[-1], node_colors["b"])
+
+    def test_sequential_colors_log_scale_non_positive(self):
+        for value in [0.0, -1.0]:
+            with self.assertRaises(ValueError):
+                sequential_colors({"a": 1.0, "b": value}, use_log_scale=True)
+
+    def test_sequential_colors_single_value(self):
+        color_list = _CACHED_LIGHT["sequential"]
+        node_colors = sequential_colors({"a": 3.0, "b": 3.0})
+        self.assertEqual({"a": color_list[0], "b": color_list[0]}, node_colors)
+
+
+if __name__ == "__main__":
+    unittest.main()
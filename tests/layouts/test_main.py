@@ -0,0 +1,61 @@
+# Copyright (c) Microsoft Corporation and contributors.
+# Licensed under the MIT License.
+
+import os
+import tempfile
+import unittest
+
+from graspologic.layouts.__main__ import _graph_from_file
+
+
+class TestMain(unittest.TestCase):
+    def _write(self, contents: str) -> str:
+        handle, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "w") as edge_io:
+            edge_io.write(contents)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_graph_from_file_weighted(self):
+        path = self._write("source,target,weight\na,b,1.5\nb,c,2\nb,a,0.5\n")
+        graph = _graph_from_file(path, skip_header=True)
+        self.assertEqual(3, graph.number_of_nodes())
+        self.assertEqual(2.0, graph["a"]["b"]["weight"])
+        self.assertEqual(2.0, graph["b"]["c"]["weight"])
+
+    def test_graph_from_file_unweighted(self):
+        path = self._write("1,2\n2,3\n\n1,2\n")
+        graph = _graph_from_file(path)
+        self.assertEqual({"1", "2", "3"}, set(graph.nodes()))
+        self.assertEqual(2.0, graph["1"]["2"]["weight"])
+        self.assertEqual(1.0, graph["2"]["3"]["weight"])
+
+    def test_graph_from_file_too_many_columns(self):
+        path = self._write("a,b,1.0,extra\n")
+        with self.assertRaises(IOError):
+            _graph_from_file(path)
+
+        path = self._write("a,b\nb,c,1.0,extra\n")
+        with self.assertRaises(IOError):
+            _graph_from_file(path)
+
+    def test_graph_from_file_mixed_columns(self):
+        path = self._write("a,b,1.5\nb,c\n")
+        graph = _graph_from_file(path)
+        self.assertEqual(1.5, graph["a"]["b"]["weight"])
+        self.assertEqual(1.0, graph["b"]["c"]["weight"])
+
+        path = self._write("a,b\nb,c,2\n")
+        graph = _graph_from_file(path)
+        self.assertEqual(1.0, graph["a"]["b"]["weight"])
+        self.assertEqual(2.0, graph["b"]["c"]["weight"])
+
+    def test_graph_from_file_malformed_rows(self):
+        for contents in ["a\nb,c\n", "a,b,heavy\n"]:
+            path = self._write(contents)
+            with self.assertRaises(IOError):
+                _graph_from_file(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -44,6 +44,23 @@ class TestSampleCorr(unittest.TestCase):
         with self.assertRaises(TypeError):
             sample_edges_corr(self.P, self.r, directed=False, loops=6)
 
+    def test_bad_probabilities(self):
+        with self.assertRaises(ValueError):
+            P = self.P.copy()
+            P[0, 1] = 1.5
+            sample_edges_corr(P, self.R, directed=True, loops=False)
+
+        with self.assertRaises(ValueError):
+            P = self.P.copy()
+            P[0, 1] = np.nan
+            sample_edges_corr(P, self.R, directed=True, loops=False)
+
+        with self.assertRaises(ValueError):
+            # P * (1 - R) = 1.2 for a negative correlation
+            P = np.full((self.n, self.n), 0.8)
+            R = np.full((self.n, self.n), -0.5)
+            sample_edges_corr(P, R, directed=True, loops=False)
+
     def test_sample_edges_corr(self):
         # P = self.p * np.ones((self.n, self.n))
         g1, g2 = sample_edges_corr(self.P, self.R, directed=False, loops=False)
@@ -66,6 +83,58 @@ class TestSampleCorr(unittest.TestCase):
         self.assertTrue(g1.shape == (self.n, self.n))
         self.assertTrue(g2.shape == (self.n, self.n))
 
+    def test_bad_probabilities_undirected(self):
+        with self.assertRaises(ValueError):
+            P = self.P.copy()
+            P[0, 1] = -0.5
+            sample_edges_corr(P, self.R, directed=False, loops=False)
+
+        with self.assertRaises(ValueError):
+            P = np.full((self.n, self.n), 0.8)
+            R = np.full((self.n, self.n), -0.5)
+            sample_edges_corr(P, R, directed=False, loops=True)
+
+    def test_sample_edges_corr_loops(self):
+        g1, g2 = sample_edges_corr(self.P, self.R, directed=False, loops=True)
+
+        # the diagonal is sampled and both graphs stay symmetric
+        self.assertTrue(np.diag(g1).sum() > 0)
+        self.assertTrue(np.diag(g2).sum() > 0)
+        self.assertTrue(np.array_equal(g1, g1.T))
+        self.assertTrue(np.array_equal(g2, g2.T))
+        self.assertTrue(np.isclose(self.p, g2.sum() / self.n**2, atol=0.05))
+
+    def test_sample_edges_corr_directed(self):
+        g1, g2 = sample_edges_corr(self.P, self.R, directed=True, loops=False)
+
+        # no loops and no forced symmetry
+        self.assertEqual(np.diag(g1).sum(), 0)
+        self.assertEqual(np.diag(g2).sum(), 0)
+        self.assertFalse(np.array_equal(g1, g1.T))
+
+        # check the marginal of each graph and rho
+        self.assertTrue(
+            np.isclose(self.p, g1.sum() / (self.n * (self.n - 1)), atol=0.05)
+        )
+        self.assertTrue(
+            np.isclose(self.p, g2.sum() / (self.n * (self.n - 1)), atol=0.05)
+        )
+        k1 = g1[np.where(~np.eye(self.n, dtype=bool))]
+        k2 = g2[np.where(~np.eye(self.n, dtype=bool))]
+        output_r = np.corrcoef(k1, k2)[0, 1]
+        self.assertTrue(np.isclose(self.r, output_r, atol=0.06))
+
+    def test_sample_edges_corr_seeded(self):
+        for directed in [False, True]:
+            np.random.seed(8888)
+            g1, g2 = sample_edges_corr(self.P, self.R, directed, loops=False)
+            after = np.random.random()
+            np.random.seed(8888)
+            h1, h2 = sample_edges_corr(self.P, self.R, directed, loops=False)
+            self.assertTrue(np.array_equal(g1, h1))
+            self.assertTrue(np.array_equal(g2, h2))
+            self.assertEqual(after, np.random.random())
+
 
 class TestERCorr(unittest.TestCase):
     @classmethod
@@ -104,6 +173,9 @@ class TestERCorr(unittest.TestCase):
             r = 5.0
             er_corr(self.n, self.p, r, directed=False, loops=False)
 
+        with self.assertRaises(ValueError):
+            er_corr(200, 0.8, -0.5, directed=True, loops=False)
+
     def test_er_corr(self):
         g1, g2 = er_corr(self.n, self.p, self.r, directed=False, loops=False)
         # check the 1 probability of the output binary matrix
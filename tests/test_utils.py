@@ -332,6 +332,53 @@ class TestLCC(unittest.TestCase):
         lcc_adjacency = gus.largest_connected_component(adjacency)
         assert lcc_adjacency.shape[0] == 1
 
+    def test_lcc_networkx_no_copy(self):
+        g = nx.Graph()
+        nx.add_path(g, [1, 2, 3])
+        g.add_edge(4, 5)
+        lcc = gus.largest_connected_component(g, copy=False)
+        self.assertEqual({1, 2, 3}, set(lcc.nodes()))
+        self.assertTrue(nx.is_frozen(lcc))
+        g[1][2]["weight"] = 5
+        self.assertEqual(5, lcc[1][2]["weight"])
+
+    def test_lcc_networkx_subclass(self):
+        class LabeledDiGraph(nx.DiGraph):
+            pass
+
+        g = LabeledDiGraph()
+        nx.add_path(g, [1, 2, 3])
+        g.add_edge(4, 5)
+        lcc = gus.largest_connected_component(g)
+        self.assertEqual({1, 2, 3}, set(lcc.nodes()))
+
+    def test_lcc_networkx_stops_after_dominant_component(self):
+        def components():
+            yield {0, 1, 2}
+            yield {3}
+            raise AssertionError("components consumed after the lcc was known")
+
+        self.assertEqual(gus._largest_component_nodes(components(), 5), {0, 1, 2})
+
+    def test_lcc_networkx_dominant_component_with_isolates(self):
+        g = nx.gnm_random_graph(5000, 20000, seed=1234)
+        expected = max(nx.connected_components(g), key=len)
+        g.add_nodes_from(range(5000, 15000))
+        lcc, nodelist = gus.largest_connected_component(g, return_inds=True)
+        self.assertEqual(expected, set(lcc.nodes()))
+        self.assertEqual(expected, set(nodelist.tolist()))
+
+    def test_lcc_networkx_graph_types(self):
+        for graph_type in [nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph]:
+            g = nx.path_graph(1500, create_using=graph_type)
+            nx.add_path(g, range(2000, 2100))
+            g.add_node(5000)
+            lcc, nodelist = gus.largest_connected_component(g, return_inds=True)
+            self.assertIsInstance(lcc, graph_type)
+            self.assertEqual(lcc.number_of_nodes(), 1500)
+            self.assertEqual(lcc.number_of_edges(), 1499)
+            np.testing.assert_array_equal(np.sort(nodelist), np.arange(1500))
+
     def test_multigraph_lcc_numpystack(self):
         expected_g_matrix = np.array(
             [[0, 1, 0, 0], [0, 0, 1, 1], [0, 0, 0, 0], [0, 1, 0, 0]]